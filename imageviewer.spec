@@ -24,7 +24,6 @@ a = Analysis(
         'PIL.ImageTk',
         'PIL.ExifTags',
         'src',
-        'src.calculate_max_zoom',
         'src.display_image',
         'src.handle_zoom',
         'src.handle_pan',
@@ -32,6 +31,8 @@ a = Analysis(
         'src.zoom_out',
         'src.image_metadata',
         'src.on_resize',
+        'src.schedule_redraw',
+        'src.tile_cache',
         'src.update_cursor_info',
         'src.services',
         'src.services.gemini_image_service',
@@ -2,33 +2,54 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import argparse
-import io
 import logging
 import os
+import shutil
 import sys
-import tempfile
 import threading
 import tkinter as tk
-from tkinter import filedialog
+from concurrent.futures import ThreadPoolExecutor
 
+import PIL
 from PIL import Image, ImageTk
 
-from src.calculate_max_zoom import calculate_max_zoom as calc_max_zoom
-from src.display_image import display_image as display_image_fn
+from src.display_image import IS_WIN32, TILE_CACHE_SIZE, cancel_refine as cancel_refine_fn, display_image as display_image_fn
 from src.handle_zoom import handle_zoom as handle_zoom_fn
 from src.handle_pan import handle_pan_start, handle_pan_drag, handle_pan_end
 from src.zoom_in import zoom_in as zoom_in_fn
 from src.zoom_out import zoom_out as zoom_out_fn
 from src.image_metadata import build_metadata_text
-from src.on_resize import on_resize as on_resize_fn
-from src.services.gemini_image_service import (
-    GeminiServiceError,
-    generate_image_edit,
-)
-from src.update_cursor_info import update_cursor_info as update_cursor_info_fn
+from src.on_resize import on_canvas_configure as on_canvas_configure_fn, on_resize as on_resize_fn
+from src.schedule_redraw import schedule_redraw as schedule_redraw_fn
+from src.tile_cache import TileCache
+from src.update_cursor_info import pixel_access, pixel_hex_formatter, throttle_cursor_info
 
 logger = logging.getLogger(__name__)
 
+# Largest rendered image size the viewer will produce (4K UHD)
+MAX_DISPLAY_SIZE = (3840, 2160)
+# Zoom never goes past this, however small the image
+MAX_ZOOM_FACTOR = 10.0
+
+# Leading bytes of the formats Gemini may return, mapped to a file extension
+GENERATED_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"RIFF", ".webp"),
+)
+
+# Canvas setup with Windows quality improvements
+CANVAS_CONFIG = {
+    'bg': 'gray20',
+    'highlightthickness': 0,
+}
+if IS_WIN32:
+    # Windows-specific canvas optimizations
+    CANVAS_CONFIG.update({
+        'borderwidth': 0,
+        'relief': tk.FLAT,
+    })
+
 
 class SimpleImageViewer:
     def __init__(self, root, image_path=None, debug_enabled=False, logger_instance=None):
@@ -43,31 +64,38 @@ class SimpleImageViewer:
 
         # Initialize image-related attributes
         self.original_image = None
-        self.original_size = None
+        self.original_size = None  # Size of the decoded image all view math uses
         self.image_path = None
+        self._pixels = None  # Cached pixel access for cursor color lookups
+        self._pixel_hex = None  # Formats a pixel of _pixels as a hex color
+        self._tile_cache = TileCache(TILE_CACHE_SIZE)  # Rendered tiles, LRU-bounded
+        self._tile_items = {}  # (col, row) -> (canvas item, photo, hq) for placed tiles
+        self._tile_layer = None  # Zoomed size the placed tiles were rendered for
+        self._tile_origin = (0, 0)  # image_pos the placed tiles are positioned for
+        self._placed_view = None  # (image_pos, canvas size) the placed tiles cover
+        self._interactive = False  # True while a zoom/pan gesture is in progress
+        self._refine_after_id = None  # Pending LANCZOS refinement of the view
+        # LANCZOS tile rendering runs here so it never blocks the Tk event loop
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tile-render")
+        self._refine_future = None
 
         # Define zoom constraints - will be updated when image is loaded
         self.min_zoom = 1.0
         self.max_zoom = 1.0  # Default, will be updated when image loads
         self.zoom_level = self.min_zoom  # Start at minimum zoom (1.0x)
 
+        # Gemini requests run on a background asyncio loop, started on first use
+        self._async_loop = None
+        self._generation_future = None  # In-flight request, cancelled when the window closes
+
         # Main frame to hold canvas and debug panel
         main_frame = tk.Frame(root)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Canvas setup with Windows quality improvements
-        canvas_config = {
-            'bg': 'gray20',
-            'highlightthickness': 0,
-        }
-        if sys.platform == 'win32':
-            # Windows-specific canvas optimizations
-            canvas_config.update({
-                'borderwidth': 0,
-                'relief': tk.FLAT,
-            })
-        self.canvas = tk.Canvas(main_frame, **canvas_config)
+        self.canvas = tk.Canvas(main_frame, **CANVAS_CONFIG)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Kept current by <Configure>; the default stands in until the canvas is mapped
+        self._canvas_size = (800, 600)
 
         # Debug panel frame
         debug_frame = tk.Frame(main_frame, width=200, bg='gray15', padx=10, pady=10)
@@ -123,14 +151,19 @@ class SimpleImageViewer:
         # Debug labels
         tk.Label(debug_frame, text="DEBUG INFO", bg='gray15', fg='white').pack(pady=(0, 10))
 
-        self.cursor_label = tk.Label(debug_frame, text="Cursor: (0, 0)", bg='gray15', fg='white')
+        # Labels rewritten per event are driven by StringVars, so an update is
+        # a variable write rather than a pass through the widget's option parsing
+        self.cursor_var = tk.StringVar(value="Cursor: (0, 0)")
+        self.cursor_label = tk.Label(debug_frame, textvariable=self.cursor_var, bg='gray15', fg='white')
         self.cursor_label.pack(anchor=tk.W, pady=2)
 
         self.hex_label = tk.Label(debug_frame, text="Hex: #000000", bg='gray15', fg='white')
         self.hex_label.pack(anchor=tk.W, pady=2)
+        self._hex_label_state = None  # Last (text, color) written to hex_label
 
         # Now self.min_zoom is defined, so this works
-        self.zoom_label = tk.Label(debug_frame, text=f"Zoom: {self.zoom_level:.1f}x", bg='gray15', fg='white')
+        self.zoom_var = tk.StringVar(value=f"Zoom: {self.zoom_level:.1f}x")
+        self.zoom_label = tk.Label(debug_frame, textvariable=self.zoom_var, bg='gray15', fg='white')
         self.zoom_label.pack(anchor=tk.W, pady=2)
 
         # Image metadata (bottom of panel)
@@ -163,15 +196,34 @@ class SimpleImageViewer:
         self.cursor_pos = (0, 0)
         self.image_pos = (0, 0)
         self.image_size = (0, 0)
+        self.is_pannable = False
 
         # Panning state
         self.is_panning = False
         self.pan_start_pos = None
         self.pan_start_image_pos = None
+        self.pan_last_pos = None  # Pointer position of the last handled drag event
+        self._pan_event = None  # Latest <B1-Motion> event not yet applied
+        self._pan_after_id = None
 
         # Cursor crosshair lines
         self.cursor_h_line = None  # Horizontal line ID
         self.cursor_v_line = None  # Vertical line ID
+        self._cursor_line_coords = (None, None)  # Last (horizontal, vertical) coords written
+
+        # Pending debounced redraw after a window resize
+        self._resize_after_id = None
+        self._last_size = None  # Last toplevel size seen by on_resize
+
+        # Coalesced redraw state (see schedule_redraw)
+        self._redraw_pending = False
+        self._redraw_zoom_center = None
+        self._last_redraw_time = 0.0
+
+        # Throttled <Motion> handling state (see throttle_cursor_info)
+        self._motion_event = None
+        self._motion_after_id = None
+        self._last_motion_time = 0.0
         
         # Bind events
         self.canvas.bind("<MouseWheel>", self.handle_zoom)
@@ -180,7 +232,9 @@ class SimpleImageViewer:
         self.root.bind("<Control-equal>", self.zoom_in)
         self.canvas.bind("<Motion>", self.update_cursor_info)
         self.root.bind("<Configure>", self.on_resize)
-        self.root.bind("<Escape>", lambda e: root.destroy())
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        self.root.bind("<Escape>", self.handle_close)
+        self.root.protocol("WM_DELETE_WINDOW", self.handle_close)
         
         # Panning events (left mouse button drag)
         self.canvas.bind("<Button-1>", self.handle_pan_start)
@@ -198,15 +252,52 @@ class SimpleImageViewer:
 
         self.action_button.config(state=tk.DISABLED, text="Generating…")
         self._set_status("Contacting Gemini…")
-        worker = threading.Thread(
-            target=self._run_generation,
-            args=(api_key, prompt),
-            daemon=True,
+        import asyncio  # Deferred, see _ensure_async_loop
+
+        self._generation_future = asyncio.run_coroutine_threadsafe(
+            self._run_generation(api_key, prompt),
+            self._ensure_async_loop(),
         )
-        worker.start()
+
+    def _ensure_async_loop(self):
+        """Return the background event loop, starting its thread if needed."""
+        if self._async_loop is None:
+            # Deferred like the Gemini service: asyncio is only needed once Generate is used
+            import asyncio
+
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="gemini-loop", daemon=True).start()
+            self._async_loop = loop
+            self._log_debug("Background asyncio loop started for Gemini requests")
+        return self._async_loop
+
+    def _run_blocking(self, func, *args):
+        """Run a blocking call on a daemon thread and return an awaitable for its result."""
+        # Not loop.run_in_executor: the default executor's threads are joined at
+        # exit, so a cancelled request would keep the process alive until the
+        # HTTP call (with its retries) gave up
+        loop = self._async_loop
+        future = loop.create_future()
+
+        def resolve(setter, value):
+            if not future.done():  # Cancelled meanwhile
+                setter(value)
+
+        def work():
+            try:
+                result = func(*args)
+            except Exception as exc:  # pylint: disable=broad-except
+                loop.call_soon_threadsafe(resolve, future.set_exception, exc)
+            else:
+                loop.call_soon_threadsafe(resolve, future.set_result, result)
+
+        threading.Thread(target=work, name="gemini-request", daemon=True).start()
+        return future
 
     def show_image_selection_dialog(self):
         """Show dialog to select an image file from system."""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
             title="Select Image File",
             filetypes=[
@@ -235,17 +326,35 @@ class SimpleImageViewer:
         file_menu.add_separator()
         file_menu.add_command(label="Save As...", command=self.handle_save_click, accelerator="Ctrl+S")
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit, accelerator="Ctrl+Q")
-
-        # Bind keyboard shortcuts
-        self.root.bind("<Control-o>", lambda e: self.handle_open_file())
-        self.root.bind("<Control-O>", lambda e: self.handle_open_file())
-        self.root.bind("<Control-s>", lambda e: self.handle_save_click())
-        self.root.bind("<Control-S>", lambda e: self.handle_save_click())
-        self.root.bind("<Control-q>", lambda e: self.root.quit())
-        self.root.bind("<Control-Q>", lambda e: self.root.quit())
-
-    def handle_open_file(self):
+        file_menu.add_command(label="Exit", command=self.handle_quit, accelerator="Ctrl+Q")
+
+        # Bind keyboard shortcuts; the handlers accept the event directly
+        self.root.bind("<Control-o>", self.handle_open_file)
+        self.root.bind("<Control-O>", self.handle_open_file)
+        self.root.bind("<Control-s>", self.handle_save_click)
+        self.root.bind("<Control-S>", self.handle_save_click)
+        self.root.bind("<Control-q>", self.handle_quit)
+        self.root.bind("<Control-Q>", self.handle_quit)
+
+    def handle_quit(self, event=None):
+        """Handle File -> Exit and Ctrl+Q."""
+        self._stop_background_work()
+        self.root.quit()
+
+    def handle_close(self, event=None):
+        """Close the window (Escape or the window manager's close button)."""
+        self._stop_background_work()
+        self.root.destroy()
+
+    def _stop_background_work(self):
+        """Cancel Gemini and tile work so nothing calls back into a closed window."""
+        if self._generation_future is not None:
+            self._generation_future.cancel()
+            self._generation_future = None
+        cancel_refine_fn(self)
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+
+    def handle_open_file(self, event=None):
         """Handle File -> Open menu action."""
         try:
             file_path = self.show_image_selection_dialog()
@@ -267,18 +376,23 @@ class SimpleImageViewer:
     def load_image(self, image_path):
         """Load an image and initialize viewer state."""
         try:
-            self.original_image = Image.open(image_path)
-            self.original_size = self.original_image.size
+            image = Image.open(image_path)
+            # Decode before touching viewer state, so a truncated or corrupt
+            # file fails here and leaves the current image displayed
+            image.load()
+
+            self.original_image = image
+            self.original_size = image.size
             self.image_path = os.path.abspath(image_path)
             self._log_debug("Loaded image %s (%s)", image_path, self.original_size)
 
             # Update zoom constraints now that we have an image
-            self.max_zoom = self.calculate_max_zoom()
-            self.zoom_level = self.min_zoom
+            self._reset_image_state()
 
-            # Update UI components that depend on having an image
-            self.update_metadata_panel()
+            # Update UI components that depend on having an image. The image is
+            # painted first; metadata (EXIF parsing) fills in once Tk is idle.
             self.display_image()
+            self.root.after_idle(self.update_metadata_panel)
 
         except Exception as e:
             error_msg = f"Error loading image: {e}"
@@ -289,8 +403,10 @@ class SimpleImageViewer:
                 self._set_status(error_msg, error=True)
             raise
 
-    def handle_save_click(self):
+    def handle_save_click(self, event=None):
         """Handle save button click - open file dialog and save image."""
+        from tkinter import filedialog
+
         try:
             # Get the original filename to suggest as default
             default_filename = os.path.basename(self.image_path)
@@ -312,8 +428,17 @@ class SimpleImageViewer:
             )
 
             if file_path:
-                # Save the original image (not the zoomed/resized version)
-                self.original_image.save(file_path)
+                src_ext = os.path.splitext(self.image_path)[1].lower()
+                dst_ext = os.path.splitext(file_path)[1].lower()
+                if src_ext == dst_ext and os.path.isfile(self.image_path):
+                    # Same format as the file on disk: copy the bytes, don't re-encode
+                    try:
+                        shutil.copyfile(self.image_path, file_path)
+                    except shutil.SameFileError:
+                        pass  # Saving over the source in its own format changes nothing
+                else:
+                    # Save the original image (not the zoomed/resized version)
+                    self.original_image.save(file_path)
                 self._set_status(f"Image saved to: {os.path.basename(file_path)}", error=False)
                 self._log_debug("Image saved to: %s", file_path)
             else:
@@ -323,10 +448,16 @@ class SimpleImageViewer:
             self._set_status(error_msg, error=True)
             self._log_debug("Save failed: %s", exc)
 
-    def _run_generation(self, api_key, prompt):
-        self._log_debug("Gemini generation started on worker thread.")
+    async def _run_generation(self, api_key, prompt):
+        # Deferred so the Gemini SDK is only imported once Generate is used
+        from src.services.gemini_image_service import (
+            GeminiServiceError,
+            generate_image_edit,
+        )
+
+        self._log_debug("Gemini generation started on background loop.")
         try:
-            image_bytes = generate_image_edit(api_key, prompt, self.image_path)
+            image_bytes = await self._run_blocking(generate_image_edit, api_key, prompt, self.image_path)
         except (ValueError, GeminiServiceError, OSError) as exc:
             self._log_debug("Gemini generation failed: %s", exc)
             error_msg = str(exc)
@@ -343,37 +474,52 @@ class SimpleImageViewer:
             self.root.after(0, lambda: self._generation_failed(f"Unexpected error: {error_msg}"))
             return
 
-        self.root.after(0, lambda: self._generation_succeeded(image_bytes))
+        # Write the payload to disk here so only a path crosses back to the UI thread
+        try:
+            new_path = await self._run_blocking(self._persist_generated_image, image_bytes)
+        except OSError as exc:
+            self._log_debug("Persisting generated image failed: %s", exc)
+            error_msg = f"Failed to store generated image: {exc}"
+            self.root.after(0, lambda: self._generation_failed(error_msg))
+            return
+
+        self.root.after(0, lambda: self._generation_succeeded(new_path))
 
     def _generation_failed(self, message):
+        self._generation_future = None
         self.action_button.config(state=tk.NORMAL, text="Generate")
         self._set_status(message, error=True)
 
-    def _generation_succeeded(self, image_bytes):
+    def _generation_succeeded(self, new_path):
+        self._generation_future = None
         try:
-            new_image = Image.open(io.BytesIO(image_bytes))
-            new_image.load()
-            self._log_debug("Generated image loaded (%s)", new_image.size)
+            # Decoded straight from the persisted file, like any opened image
+            self.load_image(new_path)
         except Exception as exc:  # pylint: disable=broad-except
+            try:
+                os.remove(new_path)
+            except OSError:
+                pass
             self._generation_failed(f"Failed to load generated image: {exc}")
             return
 
-        new_path = self._persist_generated_image(image_bytes)
-        self.original_image = new_image
-        self.original_size = new_image.size
-        self.image_path = new_path
-        self.max_zoom = self.calculate_max_zoom()
-        self.zoom_level = self.min_zoom
-        self.display_image()
-        self.update_metadata_panel()
-
         self.action_button.config(state=tk.NORMAL, text="Generate")
         self._set_status("Image updated.", error=False)
 
     def _persist_generated_image(self, image_bytes):
+        import tempfile
+
+        # The payload is written as-is, which is cheaper than decoding and
+        # re-encoding it; name the file after its real format so that saving
+        # with the same extension can copy it byte for byte
+        suffix = ".png"
+        for signature, extension in GENERATED_IMAGE_SIGNATURES:
+            if image_bytes.startswith(signature):
+                suffix = extension
+                break
         tmp_file = tempfile.NamedTemporaryFile(
             delete=False,
-            suffix=".png",
+            suffix=suffix,
             prefix="imageviewer_gemini_",
         )
         with tmp_file:
@@ -388,14 +534,31 @@ class SimpleImageViewer:
             self.status_label.config(fg=color)
         self._log_debug("Status update -> %s", message)
     
+    def _reset_image_state(self):
+        """Recompute zoom limits and derived image caches for a new original_image."""
+        self.max_zoom = self.calculate_max_zoom()
+        self.zoom_level = self.min_zoom
+        self._pixels = pixel_access(self.original_image)
+        self._pixel_hex = pixel_hex_formatter(self.original_image)
+        # Tiles of the previous image must not be reused even at the same size
+        self._tile_cache.clear()
+        self._tile_layer = None
+
     def calculate_max_zoom(self):
         """Calculate max zoom to not exceed 4K resolution"""
-        return calc_max_zoom(self.original_size)
+        width, height = self.original_size or (0, 0)
+        if not width or not height:
+            return 1.0
+        return min(MAX_DISPLAY_SIZE[0] / width, MAX_DISPLAY_SIZE[1] / height, MAX_ZOOM_FACTOR)
     
     def display_image(self, zoom_center=None):
         """Display image at current zoom level with optional zoom center"""
         return display_image_fn(self, zoom_center=zoom_center)
     
+    def schedule_redraw(self, zoom_center=None):
+        """Coalesce redraw requests into one display_image call when idle"""
+        return schedule_redraw_fn(self, zoom_center=zoom_center)
+    
     def handle_zoom(self, event):
         """Handle mouse wheel zoom with cursor focus"""
         return handle_zoom_fn(self, event)
@@ -410,11 +573,15 @@ class SimpleImageViewer:
     
     def update_cursor_info(self, event):
         """Update cursor position and color hex in debug panel"""
-        return update_cursor_info_fn(self, event)
+        return throttle_cursor_info(self, event)
     
     def on_resize(self, event):
         """Handle window resize"""
         return on_resize_fn(self, event)
+
+    def on_canvas_configure(self, event):
+        """Track the canvas size"""
+        return on_canvas_configure_fn(self, event)
     
     def handle_pan_start(self, event):
         """Handle mouse button press to start panning"""
@@ -481,7 +648,7 @@ def configure_logging(debug_enabled: bool):
 
 def setup_windows_dpi():
     """Configure DPI awareness for Windows to improve rendering quality."""
-    if sys.platform == 'win32':
+    if IS_WIN32:
         try:
             # Try to set DPI awareness for better rendering on high-DPI displays
             import ctypes
@@ -503,12 +670,10 @@ def main():
     args = parse_cli_args()
     configure_logging(args.debug)
     logger.info("Launching SimpleImageViewer (debug=%s)", args.debug)
-
-    # Check if image path was provided and exists
-    if args.image_path and not os.path.exists(args.image_path):
-        logger.error("Image not found: %s", args.image_path)
-        print(f"Image not found: {args.image_path}")
-        sys.exit(1)
+    # Pillow-SIMD builds carry a ".postN" suffix; log it so a build that
+    # silently fell back to stock Pillow (slower resizes) is visible
+    pil_version = PIL.__version__
+    logger.info("Using %s %s", "Pillow-SIMD" if ".post" in pil_version else "Pillow", pil_version)
 
     # Setup Windows DPI awareness before creating Tk root
     setup_windows_dpi()
@@ -516,7 +681,7 @@ def main():
     root = tk.Tk()
 
     # Windows-specific optimizations
-    if sys.platform == 'win32':
+    if IS_WIN32:
         # Improve canvas rendering quality
         try:
             # Set canvas to use better rendering
@@ -524,7 +689,14 @@ def main():
         except Exception:
             pass
 
-    app = SimpleImageViewer(root, args.image_path, debug_enabled=args.debug, logger_instance=logger)
+    try:
+        app = SimpleImageViewer(root, args.image_path, debug_enabled=args.debug, logger_instance=logger)
+    except FileNotFoundError:
+        # Raised by Image.open in load_image; no separate existence check is made
+        logger.error("Image not found: %s", args.image_path)
+        print(f"Image not found: {args.image_path}")
+        root.destroy()
+        sys.exit(1)
 
     root.mainloop()
 
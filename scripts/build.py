@@ -6,10 +6,21 @@ Build script for creating standalone executable with PyInstaller.
 """
 
 import os
+import platform
+import re
 import shutil
 import subprocess
 import sys
 
+# Resolved once at import; the build only ever targets the host platform.
+IS_WIN32 = sys.platform == 'win32'
+EXECUTABLE_NAME = 'imageviewer.exe' if IS_WIN32 else 'imageviewer'
+
+# Separate environment for --pillow-simd builds. It lives outside build/ so
+# --clean keeps it, and Pillow-SIMD (compiled from source) is not rebuilt
+# on every run.
+PILLOW_SIMD_VENV = '.venv-pillow-simd'
+
 
 def clean_build_dirs():
     """Clean build and dist directories."""
@@ -25,8 +36,54 @@ def clean_build_dirs():
             print(f"Removed {file}")
 
 
-def build_executable(clean=False):
-    """Build the executable using PyInstaller."""
+def _project_dependencies():
+    """Return the runtime requirements listed in pyproject.toml."""
+    import tomllib  # Python 3.11+
+
+    with open('pyproject.toml', 'rb') as f:
+        return tomllib.load(f)['project']['dependencies']
+
+
+def create_pillow_simd_env():
+    """Create a Pillow-SIMD build venv (x86_64 only); return its Python, or None on failure."""
+    # Pillow-SIMD (SSE4/AVX2 resampling) is built from source and does not
+    # satisfy the pillow requirement, so it gets its own venv; a failed
+    # build leaves the environment running this script untouched
+    if platform.machine().lower() not in ('x86_64', 'amd64'):
+        print(f"Skipping Pillow-SIMD: not supported on {platform.machine()}")
+        return sys.executable
+
+    try:
+        requirements = [
+            dep for dep in _project_dependencies()
+            if re.split(r'[\s<>=!~;\[]', dep, maxsplit=1)[0].lower() != 'pillow'
+        ]
+    except ImportError:
+        print("Pillow-SIMD builds read pyproject.toml and need Python 3.11+")
+        return None
+
+    if IS_WIN32:
+        python = os.path.join(PILLOW_SIMD_VENV, 'Scripts', 'python.exe')
+    else:
+        python = os.path.join(PILLOW_SIMD_VENV, 'bin', 'python')
+
+    print(f"Preparing Pillow-SIMD build environment in {PILLOW_SIMD_VENV}/...")
+    try:
+        if not os.path.exists(python):
+            subprocess.run([sys.executable, '-m', 'venv', PILLOW_SIMD_VENV], check=True)
+        pip = [python, '-m', 'pip']
+        subprocess.run([*pip, 'install', '--upgrade', *requirements], check=True)
+        # Drop any Pillow pulled in transitively; both distributions install PIL/
+        subprocess.run([*pip, 'uninstall', '-y', 'pillow'], check=True)
+        subprocess.run([*pip, 'install', '--upgrade', 'pillow-simd'], check=True)
+        return python
+    except subprocess.CalledProcessError as e:
+        print(f"\nPillow-SIMD environment setup failed with error code: {e.returncode}")
+        return None
+
+
+def build_executable(clean=False, python=sys.executable):
+    """Build the executable using PyInstaller, running it under ``python``."""
     if clean:
         clean_build_dirs()
     
@@ -34,7 +91,7 @@ def build_executable(clean=False):
     print("=" * 50)
     
     cmd = [
-        sys.executable, '-m', 'PyInstaller',
+        python, '-m', 'PyInstaller',
         '--clean',
         '--workpath', 'build',
         '--distpath', 'dist',
@@ -45,7 +102,7 @@ def build_executable(clean=False):
         result = subprocess.run(cmd, check=True, capture_output=False)
         print("\n" + "=" * 50)
         print("Build completed successfully!")
-        print(f"Executable location: dist/imageviewer{'.exe' if sys.platform == 'win32' else ''}")
+        print(f"Executable location: dist/{EXECUTABLE_NAME}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"\nBuild failed with error code: {e.returncode}")
@@ -66,13 +123,24 @@ def main():
         action='store_true',
         help='Clean build directories before building'
     )
+    parser.add_argument(
+        '--pillow-simd',
+        action='store_true',
+        help='Bundle Pillow-SIMD instead of Pillow (x86_64 only)'
+    )
     args = parser.parse_args()
     
     if not os.path.exists('imageviewer.spec'):
         print("Error: imageviewer.spec not found!")
         sys.exit(1)
     
-    success = build_executable(clean=args.clean)
+    python = sys.executable
+    if args.pillow_simd:
+        python = create_pillow_simd_env()
+        if python is None:
+            sys.exit(1)
+
+    success = build_executable(clean=args.clean, python=python)
     sys.exit(0 if success else 1)
 
 
@@ -4,11 +4,29 @@
 """Rendering logic for displaying the image on the canvas."""
 
 import logging
+import sys
+from tkinter import TclError
 
 from PIL import Image, ImageTk
 
 logger = logging.getLogger(__name__)
 
+IS_WIN32 = sys.platform == 'win32'
+
+# Indexed modes, which Pillow only ever resizes with NEAREST
+NEAREST_MODES = frozenset({"1", "P"})
+
+# Quiet period after the last zoom/pan event before the view is re-rendered
+# with LANCZOS; tiles drawn during the gesture use the cheaper NEAREST
+REFINE_DELAY_MS = 120
+
+# Edge length of the square tiles the zoomed image is split into
+TILE_SIZE = 256
+
+# Rendered tiles kept across pans and zoom levels; a maximised 4K canvas
+# shows about 60 tiles including the prefetch ring
+TILE_CACHE_SIZE = 192
+
 
 def display_image(viewer, zoom_center=None):
     """
@@ -25,32 +43,20 @@ def display_image(viewer, zoom_center=None):
         logger.debug("No image loaded, skipping display")
         return
 
-    logger.debug("Displaying image at zoom %.2fx (center=%s)", viewer.zoom_level, zoom_center)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Displaying image at zoom %.2fx (center=%s)", viewer.zoom_level, zoom_center)
     # Apply constraints
     viewer.zoom_level = max(viewer.min_zoom, min(viewer.zoom_level, viewer.max_zoom))
 
     # Calculate new size
     new_width = int(viewer.original_size[0] * viewer.zoom_level)
     new_height = int(viewer.original_size[1] * viewer.zoom_level)
-    logger.debug("Resized dimensions: %dx%d (original: %s)", new_width, new_height, viewer.original_size)
-
-    # Resize image with high-quality interpolation
-    # LANCZOS provides the best quality for downscaling, LANCZOS for upscaling too
-    resized = viewer.original_image.resize((new_width, new_height), Image.LANCZOS)
-    
-    # On Windows, ensure image is converted to RGB mode for better compatibility
-    import sys
-    if sys.platform == 'win32' and resized.mode != 'RGB':
-        resized = resized.convert('RGB')
-    
-    viewer.photo = ImageTk.PhotoImage(resized)
-
-    # Clear canvas
-    viewer.canvas.delete("all")
+    if debug:
+        logger.debug("Resized dimensions: %dx%d (original: %s)", new_width, new_height, viewer.original_size)
 
     # Calculate image position
-    canvas_width = viewer.canvas.winfo_width() or 800  # Default if not yet mapped
-    canvas_height = viewer.canvas.winfo_height() or 600
+    canvas_width, canvas_height = viewer._canvas_size
 
     if zoom_center and viewer.image_size[0] > 0 and viewer.image_size[1] > 0:
         # Get current image bounds
@@ -84,16 +90,17 @@ def display_image(viewer, zoom_center=None):
         new_x = max(0, (canvas_width - new_width) // 2)
         new_y = max(0, (canvas_height - new_height) // 2)
 
-    # Draw image
-    viewer.canvas.create_image(new_x, new_y, anchor="nw", image=viewer.photo)
-
     # Store current image position and size
     viewer.image_pos = (new_x, new_y)
     viewer.image_size = (new_width, new_height)
-    logger.debug("Image positioned at (%d, %d) with size %dx%d", new_x, new_y, new_width, new_height)
+    viewer.is_pannable = new_width > canvas_width or new_height > canvas_height
+    if debug:
+        logger.debug("Image positioned at (%d, %d) with size %dx%d", new_x, new_y, new_width, new_height)
+
+    place_image(viewer)
 
     # Update debug info
-    viewer.zoom_label.config(text=f"Zoom: {viewer.zoom_level:.1f}x")
+    viewer.zoom_var.set(f"Zoom: {viewer.zoom_level:.1f}x")
     
     # Redraw cursor lines if cursor position is known
     # This ensures lines persist after image redraw
@@ -105,3 +112,208 @@ def display_image(viewer, zoom_center=None):
         # Lines will be redrawn on next mouse movement
         pass
 
+
+
+def place_image(viewer):
+    """Lay out the tiles covering the visible canvas area for ``viewer.image_pos``."""
+    # Only tiles on the canvas plus a one-tile ring are resampled; tiles that
+    # scroll out leave the canvas but stay in the tile cache
+    width, height = viewer.image_size
+    if width <= 0 or height <= 0:
+        return
+
+    layer = (width, height)
+    view = (viewer.image_pos, viewer._canvas_size)
+    if viewer._tile_layer != layer or viewer._placed_view != view:
+        _layout_tiles(viewer, layer)
+        viewer._placed_view = view
+    # Otherwise nothing moved or resized since the last call (e.g. the refine
+    # pass after a gesture, or a redraw clamped to the same position), so the
+    # placed tiles are already the right ones
+
+    if not viewer._interactive:
+        stale = [index for index, (_item, _photo, hq) in viewer._tile_items.items() if not hq]
+        if stale:
+            _submit_refine(viewer, layer, stale)
+
+
+def _layout_tiles(viewer, layer):
+    """Move, drop and create tile items so they cover the current view."""
+    # Runs per pan event: bind the viewer state used below to locals once
+    canvas = viewer.canvas
+    tile_items = viewer._tile_items
+    canvas_width, canvas_height = viewer._canvas_size
+    x, y = viewer.image_pos
+    width, height = layer
+
+    if viewer._tile_layer != layer:
+        # Zoom changed (or a new image was loaded): every placed tile is stale
+        canvas.delete("tile")
+        tile_items.clear()
+        viewer._tile_layer = layer
+        viewer._tile_origin = (x, y)
+    elif viewer._tile_origin != (x, y):
+        old_x, old_y = viewer._tile_origin
+        canvas.move("tile", x - old_x, y - old_y)
+        viewer._tile_origin = (x, y)
+
+    # Tile index range intersecting the canvas, widened by one tile each way
+    first_col = max(0, -x // TILE_SIZE - 1)
+    first_row = max(0, -y // TILE_SIZE - 1)
+    last_col = min((width - 1) // TILE_SIZE, (canvas_width - 1 - x) // TILE_SIZE + 1)
+    last_row = min((height - 1) // TILE_SIZE, (canvas_height - 1 - y) // TILE_SIZE + 1)
+    wanted = {
+        (col, row)
+        for col in range(first_col, last_col + 1)
+        for row in range(first_row, last_row + 1)
+    }
+
+    for index in [index for index in tile_items if index not in wanted]:
+        item_id, _photo, _hq = tile_items.pop(index)
+        canvas.delete(item_id)
+
+    # Newly exposed tiles are drawn right away with NEAREST mid-gesture or
+    # BILINEAR otherwise (or straight from the cache); LANCZOS versions are
+    # rendered off the UI thread.
+    # A pan within the placed tiles stops here.
+    for index in wanted.difference(tile_items):
+        photo, hq = _get_tile(viewer, layer, index)
+        item_id = canvas.create_image(
+            x + index[0] * TILE_SIZE, y + index[1] * TILE_SIZE,
+            anchor="nw", image=photo, tags="tile"
+        )
+        # Keep tiles underneath the cursor lines
+        canvas.tag_lower(item_id)
+        # The placed entry holds its own PhotoImage reference, so LRU
+        # eviction from the cache never blanks a tile that is on screen
+        tile_items[index] = (item_id, photo, hq)
+
+
+def _get_tile(viewer, layer, index):
+    """Return ``(photo, hq)`` for a tile, rendering it on a cache miss."""
+    cached = viewer._tile_cache.get((layer, index))
+    if cached is not None:
+        return cached
+
+    source = viewer.original_image
+    # A tile at the source's own scale is a plain crop, and palette/bilevel
+    # tiles come out of NEAREST identical at any filter; both are final
+    hq = source.size == layer or source.mode in NEAREST_MODES
+    # Mid-gesture a tile is on screen for a few frames at most, and NEAREST
+    # resamples several times faster than BILINEAR
+    resample = Image.NEAREST if viewer._interactive else Image.BILINEAR
+    tile = _render_tile(source, layer, index, resample)
+    cached = (ImageTk.PhotoImage(tile), hq)
+    viewer._tile_cache.put((layer, index), cached)
+    return cached
+
+
+def _render_tile(source, layer, index, resample):
+    """Resample one tile of the ``layer``-sized zoomed image from ``source``."""
+    width, height = layer
+    box = (
+        index[0] * TILE_SIZE,
+        index[1] * TILE_SIZE,
+        min(width, (index[0] + 1) * TILE_SIZE),
+        min(height, (index[1] + 1) * TILE_SIZE),
+    )
+
+    if source.mode in NEAREST_MODES:
+        # Keep indexed images indexed: Pillow would substitute NEAREST for
+        # any other filter here anyway, and the tile stays one byte per pixel
+        resample = Image.NEAREST
+
+    if source.size == layer:
+        # Already at the target scale (1.0x)
+        tile = source.crop(box)
+    else:
+        # Map the tile back onto the source; resize(box=...) crops and
+        # resamples in one pass and still filters across the tile edges,
+        # so neighbouring tiles join without seams
+        scale_x = source.width / width
+        scale_y = source.height / height
+        source_box = (box[0] * scale_x, box[1] * scale_y, box[2] * scale_x, box[3] * scale_y)
+        tile = source.resize((box[2] - box[0], box[3] - box[1]), resample, box=source_box)
+
+    # On Windows, ensure image is converted to RGB mode for better compatibility
+    if IS_WIN32 and tile.mode != 'RGB':
+        tile = tile.convert('RGB')
+    return tile
+
+
+def _render_tiles(source, layer, indexes):
+    """Worker-thread job: LANCZOS-render ``indexes``, returning PIL images only."""
+    return [(index, _render_tile(source, layer, index, Image.LANCZOS)) for index in indexes]
+
+
+def _submit_refine(viewer, layer, indexes):
+    """Render LANCZOS versions of ``indexes`` on the render worker."""
+    # A newer request supersedes one that has not started yet
+    cancel_refine(viewer)
+    source = viewer.original_image
+    # Pillow releases the GIL while resampling; Tk images are only touched
+    # back on the Tk thread, in _apply_refined
+    future = viewer._render_executor.submit(_render_tiles, source, layer, indexes)
+    viewer._refine_future = future
+    future.add_done_callback(lambda done: _post_refined(viewer, done, source, layer))
+
+
+def _post_refined(viewer, future, source, layer):
+    """Worker-thread callback: hand a finished render to the Tk thread."""
+    try:
+        viewer.root.after(0, _apply_refined, viewer, future, source, layer)
+    except (RuntimeError, TclError):
+        # The window was closed while the render ran
+        pass
+
+
+def cancel_refine(viewer):
+    """Drop a queued LANCZOS render that has not started yet."""
+    if viewer._refine_future is not None:
+        viewer._refine_future.cancel()
+        viewer._refine_future = None
+
+
+def _apply_refined(viewer, future, source, layer):
+    """Swap finished LANCZOS tiles into the cache and onto the canvas."""
+    if future is viewer._refine_future:
+        viewer._refine_future = None
+    if future.cancelled() or source is not viewer.original_image:
+        # Superseded, or rendered from an image that has since been replaced
+        return
+    try:
+        tiles = future.result()
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Tile refinement failed: %s", exc)
+        return
+
+    for index, tile in tiles:
+        placed = viewer._tile_items.get(index)
+        if layer == viewer._tile_layer and placed is not None:
+            # Same tile, same size: write the pixels into the Tk image that
+            # is already on screen instead of allocating a new one. The
+            # cache shares that PhotoImage, so it is upgraded as well.
+            photo = placed[1]
+            photo.paste(tile)
+            viewer._tile_items[index] = (placed[0], photo, True)
+        else:
+            photo = ImageTk.PhotoImage(tile)
+        viewer._tile_cache.put((layer, index), (photo, True))
+    logger.debug("Refined %d tiles of %dx%d layer with LANCZOS", len(tiles), *layer)
+
+
+def begin_interactive(viewer):
+    """Render with NEAREST until the current gesture settles, then refine."""
+    viewer._interactive = True
+    # Keep the worker free for the refinement that follows the gesture
+    cancel_refine(viewer)
+    if viewer._refine_after_id is not None:
+        viewer.root.after_cancel(viewer._refine_after_id)
+    viewer._refine_after_id = viewer.root.after(REFINE_DELAY_MS, lambda: _refine_image(viewer))
+
+
+def _refine_image(viewer):
+    """Queue LANCZOS versions of the tiles drawn mid-gesture."""
+    viewer._refine_after_id = None
+    viewer._interactive = False
+    place_image(viewer)
@@ -5,17 +5,19 @@
 
 import logging
 
+from src.display_image import begin_interactive, place_image
+
 logger = logging.getLogger(__name__)
 
 
 def handle_pan_start(viewer, event):
     """Handle mouse button press to start panning."""
-    # Only allow panning if image is larger than canvas (zoomed in)
-    canvas_width = viewer.canvas.winfo_width() or 800
-    canvas_height = viewer.canvas.winfo_height() or 600
-    if viewer.image_size[0] > canvas_width or viewer.image_size[1] > canvas_height:
+    # Only allow panning if image is larger than canvas (zoomed in); kept
+    # current by display_image and the canvas <Configure> handler
+    if viewer.is_pannable:
         viewer.pan_start_pos = (event.x, event.y)
         viewer.pan_start_image_pos = viewer.image_pos
+        viewer.pan_last_pos = viewer.pan_start_pos
         viewer.is_panning = True
         logger.debug("Pan started at (%d, %d), image_pos=(%d, %d)", 
                      event.x, event.y, viewer.image_pos[0], viewer.image_pos[1])
@@ -24,49 +26,77 @@ def handle_pan_start(viewer, event):
 
 
 def handle_pan_drag(viewer, event):
-    """Handle mouse drag to pan the image."""
+    """
+    Handle mouse drag to pan the image.
+
+    Tk delivers every <B1-Motion> event before it runs idle callbacks, so
+    deferring the work with after_idle collapses a burst of drag events into
+    a single tile placement at the latest pointer position.
+    """
     if not viewer.is_panning:
         return
 
-    # Calculate drag delta
-    dx = event.x - viewer.pan_start_pos[0]
-    dy = event.y - viewer.pan_start_pos[1]
+    viewer._pan_event = event
+    if viewer._pan_after_id is None:
+        viewer._pan_after_id = viewer.root.after_idle(lambda: _apply_pan_drag(viewer))
 
-    # Calculate new image position
-    new_x = viewer.pan_start_image_pos[0] + dx
-    new_y = viewer.pan_start_image_pos[1] + dy
 
-    # Constrain image position to canvas bounds
-    canvas_width = viewer.canvas.winfo_width() or 800
-    canvas_height = viewer.canvas.winfo_height() or 600
+def _apply_pan_drag(viewer):
+    """Move the image to follow the most recent drag event."""
+    viewer._pan_after_id = None
+    event = viewer._pan_event
 
-    # Only constrain if image is larger than canvas
-    if viewer.image_size[0] > canvas_width:
-        new_x = min(0, max(canvas_width - viewer.image_size[0], new_x))
-    else:
-        new_x = max(0, (canvas_width - viewer.image_size[0]) // 2)
+    # Touchpads and high-DPI mice repeat <B1-Motion> without the pointer
+    # moving; such events cannot change the image position
+    event_x, event_y = event.x, event.y
+    if (event_x, event_y) == viewer.pan_last_pos:
+        return
+    viewer.pan_last_pos = (event_x, event_y)
 
-    if viewer.image_size[1] > canvas_height:
-        new_y = min(0, max(canvas_height - viewer.image_size[1], new_y))
-    else:
-        new_y = max(0, (canvas_height - viewer.image_size[1]) // 2)
+    start_x, start_y = viewer.pan_start_pos
+    start_image_x, start_image_y = viewer.pan_start_image_pos
+    image_width, image_height = viewer.image_size
+    canvas_width, canvas_height = viewer._canvas_size
+
+    # Calculate drag delta
+    dx = event_x - start_x
+    dy = event_y - start_y
+
+    # Constrain image position to canvas bounds. With slack = canvas - image,
+    # a larger image may move within [slack, 0] and a smaller one is pinned
+    # at slack // 2 (centered); min/max of the two covers both cases.
+    slack_x = canvas_width - image_width
+    slack_y = canvas_height - image_height
+    new_x = min(max(0, slack_x // 2), max(min(slack_x, slack_x // 2), start_image_x + dx))
+    new_y = min(max(0, slack_y // 2), max(min(slack_y, slack_y // 2), start_image_y + dy))
+
+    # Nothing to do when the clamped position is unchanged (e.g. dragging
+    # against an edge); this also leaves a pending refinement undisturbed
+    new_pos = (int(new_x), int(new_y))
+    if new_pos == viewer.image_pos:
+        return
+    viewer.image_pos = new_pos
+
+    # Move the placed tiles, rendering any the pan newly exposes
+    begin_interactive(viewer)
+    place_image(viewer)
 
-    # Update image position
-    viewer.image_pos = (int(new_x), int(new_y))
-    
-    # Redraw image at new position
-    viewer.canvas.delete("all")
-    viewer.canvas.create_image(viewer.image_pos[0], viewer.image_pos[1], anchor="nw", image=viewer.photo)
-    
-    logger.debug("Pan drag: delta=(%d, %d), new_image_pos=(%d, %d)", dx, dy, viewer.image_pos[0], viewer.image_pos[1])
+    # Runs per <B1-Motion>; skip building the arguments unless it will be shown
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Pan drag: delta=(%d, %d), new_image_pos=(%d, %d)", dx, dy, viewer.image_pos[0], viewer.image_pos[1])
 
 
 def handle_pan_end(viewer, event):
     """Handle mouse button release to end panning."""
     if viewer.is_panning:
+        # Apply a drag still waiting for idle so the image ends where it was released
+        if viewer._pan_after_id is not None:
+            viewer.root.after_cancel(viewer._pan_after_id)
+            _apply_pan_drag(viewer)
         logger.debug("Pan ended at (%d, %d), final_image_pos=(%d, %d)", 
                      event.x, event.y, viewer.image_pos[0], viewer.image_pos[1])
         viewer.is_panning = False
         viewer.pan_start_pos = None
         viewer.pan_start_image_pos = None
+        viewer.pan_last_pos = None
 
@@ -7,23 +7,66 @@ from __future__ import annotations
 
 import logging
 import os
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from PIL import ExifTags
+from PIL.TiffImagePlugin import IFDRational
 
 logger = logging.getLogger(__name__)
 
 EXIF_TAGS = {tag_id: name for tag_id, name in ExifTags.TAGS.items()}
 
+# EXIF tags shown in the metadata panel, in display order, with their labels
+_EXIF_LABELS = (
+    ("Make", "Camera Make"),
+    ("Model", "Camera Model"),
+    ("LensModel", "Lens"),
+    ("FNumber", "Aperture"),
+    ("ExposureTime", "Exposure"),
+    ("ISOSpeedRatings", "ISO"),
+    ("FocalLength", "Focal Length"),
+    ("DateTimeOriginal", "Shot Time"),
+    ("GPSInfo", "GPS"),
+)
+_DESIRED_TAG_NAMES = frozenset(tag for tag, _label in _EXIF_LABELS)
+# The same tags keyed by EXIF id, so extraction looks up only these
+_DESIRED_TAG_IDS = {tag_id: name for tag_id, name in EXIF_TAGS.items() if name in _DESIRED_TAG_NAMES}
+
+# Metadata text of recently shown files, keyed by (abs_path, st_mtime_ns, st_size)
+METADATA_CACHE_SIZE = 16
+_metadata_cache = OrderedDict()
+
 
 def build_metadata_text(image_path: str, image) -> str:
     """
     Construct a detailed metadata string for the image, including file system
     details and any EXIF information the image exposes.
+
+    Results are memoized by path, modification time and file size, so
+    reopening an unchanged file skips the EXIF walk; only plain values are
+    kept, never the image itself.
     """
+    abs_path = os.path.abspath(image_path)
+    try:
+        file_stats = os.stat(abs_path)
+    except OSError as exc:
+        logger.debug("Error reading file stats: %s", exc)
+        file_stats = None
+
+    cache_key = None
+    if file_stats is not None:
+        cache_key = (abs_path, file_stats.st_mtime_ns, file_stats.st_size)
+        cached = _metadata_cache.get(cache_key)
+        if cached is not None:
+            _metadata_cache.move_to_end(cache_key)
+            logger.debug("Metadata cache hit for image: %s", image_path)
+            return cached
+
     logger.debug("Building metadata text for image: %s", image_path)
-    details = _collect_metadata(image_path, image)
+    details = _collect_metadata(image_path, image, file_stats)
     sections = [
         "FILE INFO",
         f" • File: {details['filename']}",
@@ -48,22 +91,26 @@ def build_metadata_text(image_path: str, image) -> str:
 
     result = "\n".join(sections)
     logger.debug("Metadata text built: %d lines, %d bytes", len(sections), len(result))
+    if cache_key is not None:
+        _metadata_cache[cache_key] = result
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
     return result
 
 
-def _collect_metadata(image_path: str, image) -> Dict[str, Any]:
+def _collect_metadata(
+    image_path: str, image, file_stats: Optional[os.stat_result] = None
+) -> Dict[str, Any]:
     """Gather raw metadata fields for internal use."""
     logger.debug("Collecting metadata for: %s", image_path)
     abs_path = os.path.abspath(image_path)
     directory = os.path.dirname(abs_path)
-    try:
-        file_stats = os.stat(abs_path)
+    if file_stats is not None:
         size_kb = file_stats.st_size / 1024
         created = _format_timestamp(file_stats.st_ctime)
         modified = _format_timestamp(file_stats.st_mtime)
         logger.debug("File stats: size=%.2f KB, created=%s, modified=%s", size_kb, created, modified)
-    except OSError as exc:
-        logger.debug("Error reading file stats: %s", exc)
+    else:
         size_kb = 0.0
         created = "Unknown"
         modified = "Unknown"
@@ -94,10 +141,11 @@ def _collect_metadata(image_path: str, image) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=256)
 def _format_timestamp(timestamp: float) -> str:
     try:
         return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-    except (ValueError, OSError):
+    except (ValueError, OSError, OverflowError):
         return "Unknown"
 
 
@@ -115,21 +163,22 @@ def _extract_exif(image) -> Dict[str, str]:
         logger.debug("No EXIF data available")
         return exif_data
 
-    desired_tags = {
-        "Make",
-        "Model",
-        "LensModel",
-        "FNumber",
-        "ExposureTime",
-        "ISOSpeedRatings",
-        "FocalLength",
-        "DateTimeOriginal",
-        "GPSInfo",
-    }
-
-    for tag_id, value in raw_exif.items():
-        tag_name = EXIF_TAGS.get(tag_id)
-        if tag_name in desired_tags:
+    # Camera settings (aperture, exposure, ISO, shot time, lens) live in the
+    # Exif sub-IFD rather than the base IFD; it is only parsed if a tag is
+    # missing from the base IFD, and only the desired ids are ever read, so
+    # large entries such as MakerNote are never decoded
+    exif_ifd = None
+    for tag_id, tag_name in _DESIRED_TAG_IDS.items():
+        if tag_id == ExifTags.IFD.GPSInfo:
+            # The base IFD only holds the offset of the GPS IFD
+            value = raw_exif.get_ifd(tag_id) or None
+        else:
+            value = raw_exif.get(tag_id)
+            if value is None:
+                if exif_ifd is None:
+                    exif_ifd = raw_exif.get_ifd(ExifTags.IFD.Exif)
+                value = exif_ifd.get(tag_id)
+        if value is not None:
             formatted_value = _format_exif_value(tag_name, value)
             exif_data[tag_name] = formatted_value
             logger.debug("EXIF tag extracted: %s = %s", tag_name, formatted_value)
@@ -142,56 +191,49 @@ def _format_exif(exif: Dict[str, str]) -> Optional[list[str]]:
     if not exif:
         return None
 
-    lines = []
-    mapping = [
-        ("Make", "Camera Make"),
-        ("Model", "Camera Model"),
-        ("LensModel", "Lens"),
-        ("FNumber", "Aperture"),
-        ("ExposureTime", "Exposure"),
-        ("ISOSpeedRatings", "ISO"),
-        ("FocalLength", "Focal Length"),
-        ("DateTimeOriginal", "Shot Time"),
-        ("GPSInfo", "GPS"),
-    ]
+    # One comprehension rather than an append call per label
+    return [f" • {label}: {value}" for key, label in _EXIF_LABELS if (value := exif.get(key))]
 
-    for key, label in mapping:
-        value = exif.get(key)
-        if value:
-            lines.append(f" • {label}: {value}")
 
-    return lines
+def _format_exif_value(tag_name: str, value: Any) -> str:
+    formatter = _EXIF_FORMATTERS.get(tag_name)
+    return formatter(value) if formatter else str(value)
 
 
-def _format_exif_value(tag_name: str, value: Any) -> str:
-    if tag_name == "FNumber":
-        try:
-            return f"f/{float(value):.1f}"
-        except (ValueError, TypeError):
-            return str(value)
-    if tag_name == "ExposureTime":
-        if isinstance(value, tuple) and value[1]:
-            return f"{value[0]}/{value[1]}s"
-        return f"{value}s"
-    if tag_name == "FocalLength":
-        if isinstance(value, tuple) and value[1]:
-            return f"{value[0]/value[1]:.1f} mm"
-        return f"{value} mm"
-    if tag_name == "ISOSpeedRatings":
-        if isinstance(value, (list, tuple)):
-            return ", ".join(str(v) for v in value)
+def _format_fnumber(value: Any) -> str:
+    try:
+        return f"f/{float(value):.1f}"
+    except (ValueError, TypeError):
         return str(value)
-    if tag_name == "GPSInfo":
-        return _format_gps(value)
+
+
+def _format_exposure(value: Any) -> str:
+    fraction = _rational_parts(value)
+    if fraction:
+        return f"{fraction[0]}/{fraction[1]}s"
+    return f"{value}s"
+
+
+def _format_focal_length(value: Any) -> str:
+    fraction = _rational_parts(value)
+    if fraction:
+        return f"{fraction[0]/fraction[1]:.1f} mm"
+    return f"{value} mm"
+
+
+def _format_iso(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
     return str(value)
 
 
 def _format_gps(gps_info: Any) -> str:
     """Convert GPS EXIF info into a readable lat/long string."""
     try:
-        gps_data = {EXIF_TAGS.get(key, key): val for key, val in gps_info.items()}
-        lat = _convert_gps_coordinate(gps_data.get("GPSLatitude"), gps_data.get("GPSLatitudeRef"))
-        lon = _convert_gps_coordinate(gps_data.get("GPSLongitude"), gps_data.get("GPSLongitudeRef"))
+        # GPS IFD keys are GPS tag ids, which overlap the base EXIF ids, so
+        # they are looked up directly rather than translated through a name table
+        lat = _convert_gps_coordinate(gps_info.get(ExifTags.GPS.GPSLatitude), gps_info.get(ExifTags.GPS.GPSLatitudeRef))
+        lon = _convert_gps_coordinate(gps_info.get(ExifTags.GPS.GPSLongitude), gps_info.get(ExifTags.GPS.GPSLongitudeRef))
         if lat is None or lon is None:
             return "Unavailable"
         return f"{lat:.6f}, {lon:.6f}"
@@ -204,13 +246,36 @@ def _convert_gps_coordinate(values, ref) -> Optional[float]:
         return None
 
     try:
-        degrees = values[0][0] / values[0][1]
-        minutes = values[1][0] / values[1][1]
-        seconds = values[2][0] / values[2][1]
-        decimal = degrees + (minutes / 60) + (seconds / 3600)
-        if ref in ("S", "W"):
-            decimal *= -1
-        return decimal
+        degrees, minutes, seconds = (_rational_to_float(value) for value in values)
+        sign = -1.0 if ref in ("S", "W") else 1.0
+        return sign * (degrees + minutes / 60.0 + seconds / 3600.0)
     except Exception:  # pylint: disable=broad-except
         return None
 
+
+def _rational_parts(value) -> Optional[tuple]:
+    """Return ``(numerator, denominator)`` of an EXIF rational, or None."""
+    if isinstance(value, tuple):
+        numerator, denominator = value
+    elif isinstance(value, IFDRational):
+        numerator, denominator = value.numerator, value.denominator
+    else:
+        return None
+    return (numerator, denominator) if denominator else None
+
+
+def _rational_to_float(value) -> float:
+    """Convert an EXIF rational, either IFDRational or a (num, den) pair."""
+    if isinstance(value, tuple):
+        return value[0] / value[1]
+    return float(value)
+
+
+# Per-tag value formatters; tags not listed are shown with str()
+_EXIF_FORMATTERS = {
+    "FNumber": _format_fnumber,
+    "ExposureTime": _format_exposure,
+    "FocalLength": _format_focal_length,
+    "ISOSpeedRatings": _format_iso,
+    "GPSInfo": _format_gps,
+}
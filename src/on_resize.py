@@ -7,13 +7,38 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Quiet period after the last <Configure> event before the image is redrawn
+RESIZE_DEBOUNCE_MS = 50
+
 
 def on_resize(viewer, event):
     """Handle window resize events by redrawing the image."""
-    if event.widget == viewer.root:
-        logger.debug("Window resize event: width=%d, height=%d", event.width, event.height)
-        # Redisplay image with current zoom level
-        viewer.display_image()
-    else:
-        logger.debug("Resize event ignored (not root widget): %s", event.widget)
+    if event.widget is not viewer.root:
+        # <Configure> bound on the toplevel also fires for every child widget
+        return
+
+    size = (event.width, event.height)
+    if size == viewer._last_size:
+        # Window moved or restacked without changing size
+        return
+    viewer._last_size = size
+    logger.debug("Window resize event: width=%d, height=%d", event.width, event.height)
+
+    # Tk emits a <Configure> per pixel of a drag-resize; coalesce the burst
+    # so the image is redisplayed once, after the window settles
+    if viewer._resize_after_id is not None:
+        viewer.root.after_cancel(viewer._resize_after_id)
+    viewer._resize_after_id = viewer.root.after(RESIZE_DEBOUNCE_MS, lambda: _redraw_after_resize(viewer))
+
+
+def on_canvas_configure(viewer, event):
+    """Record the canvas size so event handlers need not query Tk for it."""
+    viewer._canvas_size = (event.width, event.height)
+    image_width, image_height = viewer.image_size
+    viewer.is_pannable = image_width > event.width or image_height > event.height
+
 
+def _redraw_after_resize(viewer):
+    """Redisplay image with current zoom level once a resize burst has ended."""
+    viewer._resize_after_id = None
+    viewer.schedule_redraw()
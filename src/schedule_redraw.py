@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""Coalescing of redraw requests from zoom and resize events."""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between two coalesced redraws (~60 Hz)
+MIN_REDRAW_INTERVAL_MS = 16
+
+
+def schedule_redraw(viewer, zoom_center=None):
+    """Queue a display_image call, merging it with any redraw already pending."""
+    # The latest zoom center wins; a request without one keeps the earlier one
+    if zoom_center is not None:
+        viewer._redraw_zoom_center = zoom_center
+    if viewer._redraw_pending:
+        # A burst of wheel ticks or resizes costs a single redraw
+        logger.debug("Redraw already pending, request coalesced")
+        return
+
+    viewer._redraw_pending = True
+    elapsed_ms = (time.monotonic() - viewer._last_redraw_time) * 1000
+    if elapsed_ms >= MIN_REDRAW_INTERVAL_MS:
+        viewer.root.after_idle(lambda: _flush_redraw(viewer))
+    else:
+        viewer.root.after(int(MIN_REDRAW_INTERVAL_MS - elapsed_ms), lambda: _flush_redraw(viewer))
+
+
+def _flush_redraw(viewer):
+    """Run the pending redraw with the latest requested zoom center."""
+    zoom_center = viewer._redraw_zoom_center
+    viewer._redraw_pending = False
+    viewer._redraw_zoom_center = None
+    viewer._last_redraw_time = time.monotonic()
+    viewer.display_image(zoom_center=zoom_center)
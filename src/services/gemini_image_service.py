@@ -7,6 +7,7 @@ import logging
 import mimetypes
 import os
 import random
+import re
 import time
 from typing import Tuple
 from urllib.parse import parse_qs, urlparse
@@ -29,11 +30,33 @@ DEFAULT_MODEL_URL = (
     "gemini-2.5-flash-image:generateContent"
 )
 
+# Leading run of characters that can appear in an API key
+_KEY_CHARS_RE = re.compile(r"[\w=-]*")
+# First character that starts a new query parameter, fragment or query
+_QUERY_TAIL_RE = re.compile(r"[&#?]")
+
+# Upper bound on a Gemini response body; an edited image comes back base64
+# encoded inside JSON, so this leaves ample room while bounding memory
+MAX_RESPONSE_BYTES = 64 << 20
+
+# Shared HTTP session: keeps the TLS connection to the Gemini endpoint alive
+# across retries and consecutive generations instead of handshaking per call
+_SESSION = requests.Session()
+
+# Statuses that depend on the key rather than the request payload, so the
+# HTTP fallback would be refused too: unauthenticated, forbidden. A 429 from
+# the SDK still falls back, since the HTTP path retries with Retry-After
+_REJECTED_STATUSES = frozenset({401, 403})
+
 
 class GeminiServiceError(RuntimeError):
     """Raised when the Gemini service returns an error response."""
 
 
+class GeminiRequestRejected(GeminiServiceError):
+    """Raised when the API refused the caller (bad key or no access)."""
+
+
 def _normalize_api_key(raw_key: str) -> str:
     """
     Accept keys that might include full URLs, query params, or accidental duplication.
@@ -65,44 +88,17 @@ def _normalize_api_key(raw_key: str) -> str:
             key = parts[1]
             logger.debug("Extracted API key from 'key=' pattern")
         # Drop any trailing query parameters, fragments, or whitespace
-        key = key.split("&")[0].split("#")[0].split("?")[0].strip()
+        key = _QUERY_TAIL_RE.split(key, 1)[0].strip()
 
     # Find the first valid API key pattern (starts with "AIza")
     # This handles cases where there's junk before/after the actual key
-    if "AIza" in key:
-        first_aiza = key.find("AIza")
-        # Extract from "AIza" onwards, stopping at invalid characters
-        potential_key = key[first_aiza:]
-        
-        # Extract only valid API key characters
-        # API keys typically contain: A-Z, a-z, 0-9, and some special chars like -_=
-        # Stop at first invalid character (whitespace, newline, etc.)
-        valid_chars = []
-        for char in potential_key:
-            if char.isalnum() or char in "-_=":
-                valid_chars.append(char)
-            elif char.isspace() or ord(char) < 32:  # Stop at whitespace or control chars
-                break
-            else:
-                # Stop at other invalid characters
-                break
-        
-        key = "".join(valid_chars)
+    first_aiza = key.find("AIza")
+    if first_aiza >= 0:
         logger.debug("Extracted API key starting with 'AIza'")
-    else:
-        # No "AIza" found, try to extract valid characters anyway
-        # Extract only valid API key characters
-        valid_chars = []
-        for char in key:
-            if char.isalnum() or char in "-_=":
-                valid_chars.append(char)
-            elif char.isspace() or ord(char) < 32:  # Stop at whitespace or control chars
-                break
-            else:
-                # Stop at other invalid characters
-                break
-        key = "".join(valid_chars)
-    
+    # Keep only the run of valid API key characters (letters, digits, -_=),
+    # stopping at the first whitespace, control or other invalid character
+    key = _KEY_CHARS_RE.match(key, max(first_aiza, 0)).group()
+
     # Limit key length to reasonable maximum (60 chars should be more than enough)
     # Typical Gemini API keys are ~39 characters
     if len(key) > 60:
@@ -130,73 +126,91 @@ def _fetch_with_backoff(url: str, headers: dict, payload: dict, retries: int = 5
     for attempt in range(retries):
         logger.debug("Gemini request attempt %s/%s", attempt + 1, retries)
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=60)
-            if response.status_code == 200:
-                logger.debug("Gemini request succeeded on attempt %s", attempt + 1)
-                return response.json()
-
-            if response.status_code == 429:
-                # Rate limit error - check for Retry-After header
+            with _SESSION.post(url, headers=headers, data=json.dumps(payload), timeout=60, stream=True) as response:
+                status_code = response.status_code
                 retry_after = response.headers.get("Retry-After")
-                if retry_after:
-                    try:
-                        wait_time = float(retry_after)
-                        logger.warning(
-                            "Gemini rate limit (429). Server suggests waiting %.1fs. Retrying...",
-                            wait_time,
-                        )
-                        if attempt == retries - 1:
-                            break
-                        time.sleep(wait_time)
-                        # Reset backoff after using Retry-After
-                        backoff = delay
-                        continue
-                    except (ValueError, TypeError):
-                        pass  # Fall through to exponential backoff
-                
-                # Use longer backoff for rate limits (start at 5s, double each time)
-                rate_limit_backoff = max(5.0, backoff * 2.5)
-                # Add jitter to avoid thundering herd
-                jitter = random.uniform(0.5, 1.5)
-                wait_time = rate_limit_backoff * jitter
-                
-                logger.warning(
-                    "Gemini rate limit (429). Retrying in %.1fs (attempt %s/%s)",
-                    wait_time,
-                    attempt + 1,
-                    retries,
-                )
-                if attempt == retries - 1:
-                    break
-                time.sleep(wait_time)
-                backoff = rate_limit_backoff
-                continue
+                # Read the body before leaving the block, error responses
+                # included: closing a streamed response with unread data
+                # drops its connection instead of returning it to the pool
+                body = _read_capped(response)
+        except requests.exceptions.RequestException as exc:
+            logger.warning("Gemini request exception: %s", exc)
+            if attempt == retries - 1:
+                raise GeminiServiceError(f"Failed to reach Gemini API: {exc}") from exc
+            # Add jitter for network errors
+            jitter = random.uniform(0.8, 1.2)
+            time.sleep(backoff * jitter)
+            backoff *= 2
+            continue
 
-            if response.status_code >= 500:
-                logger.warning(
-                    "Gemini server error (status %s). Retrying in %.1fs",
-                    response.status_code,
-                    backoff,
-                )
+        if status_code == 200:
+            try:
+                result = json.loads(body)
+            except ValueError as exc:
+                # A truncated or garbled body is transient; retry like a network error
+                logger.warning("Gemini returned an unreadable response: %s", exc)
                 if attempt == retries - 1:
-                    break
-                # Add jitter for server errors too
+                    raise GeminiServiceError(f"Gemini returned an unreadable response: {exc}") from exc
                 jitter = random.uniform(0.8, 1.2)
                 time.sleep(backoff * jitter)
                 backoff *= 2
                 continue
-
-            raise GeminiServiceError(
-                f"Gemini API error (status {response.status_code}): {response.text}"
+            logger.debug("Gemini request succeeded on attempt %s", attempt + 1)
+            return result
+
+        if status_code == 429:
+            # Rate limit error - check for Retry-After header
+            if retry_after:
+                try:
+                    wait_time = float(retry_after)
+                    logger.warning(
+                        "Gemini rate limit (429). Server suggests waiting %.1fs. Retrying...",
+                        wait_time,
+                    )
+                    if attempt == retries - 1:
+                        break
+                    time.sleep(wait_time)
+                    # Reset backoff after using Retry-After
+                    backoff = delay
+                    continue
+                except (ValueError, TypeError):
+                    pass  # Fall through to exponential backoff
+
+            # Use longer backoff for rate limits (start at 5s, double each time)
+            rate_limit_backoff = max(5.0, backoff * 2.5)
+            # Add jitter to avoid thundering herd
+            jitter = random.uniform(0.5, 1.5)
+            wait_time = rate_limit_backoff * jitter
+
+            logger.warning(
+                "Gemini rate limit (429). Retrying in %.1fs (attempt %s/%s)",
+                wait_time,
+                attempt + 1,
+                retries,
             )
-        except requests.exceptions.RequestException as exc:
-            logger.warning("Gemini request exception: %s", exc)
             if attempt == retries - 1:
-                raise GeminiServiceError(f"Failed to reach Gemini API: {exc}") from exc
-            # Add jitter for network errors
+                break
+            time.sleep(wait_time)
+            backoff = rate_limit_backoff
+            continue
+
+        if status_code >= 500:
+            logger.warning(
+                "Gemini server error (status %s). Retrying in %.1fs",
+                status_code,
+                backoff,
+            )
+            if attempt == retries - 1:
+                break
+            # Add jitter for server errors too
             jitter = random.uniform(0.8, 1.2)
             time.sleep(backoff * jitter)
             backoff *= 2
+            continue
+
+        raise GeminiServiceError(
+            f"Gemini API error (status {status_code}): {body.decode('utf-8', 'replace')}"
+        )
 
     raise GeminiServiceError(
         "Exceeded retry budget when calling Gemini API. "
@@ -204,6 +218,20 @@ def _fetch_with_backoff(url: str, headers: dict, payload: dict, retries: int = 5
     )
 
 
+def _read_capped(response) -> bytes:
+    """Read a streamed response body, refusing anything over MAX_RESPONSE_BYTES."""
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > MAX_RESPONSE_BYTES:
+        raise GeminiServiceError(f"Gemini response too large ({int(declared)} bytes)")
+
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body.extend(chunk)
+        if len(body) > MAX_RESPONSE_BYTES:
+            raise GeminiServiceError(f"Gemini response exceeded {MAX_RESPONSE_BYTES} bytes")
+    return bytes(body)
+
+
 def _encode_image(image_path: str) -> Tuple[str, str]:
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image file not found: {image_path}")
@@ -241,6 +269,10 @@ def generate_image_edit(api_key: str, prompt: str, image_path: str) -> bytes:
     if genai is not None:
         try:
             return _generate_with_sdk(normalized_key, prompt, image_path)
+        except GeminiRequestRejected:
+            # The key was refused, which the HTTP fallback shares;
+            # other SDK errors (e.g. 400 for its payload shape) still fall back
+            raise
         except Exception as exc:
             logger.warning("SDK generation failed, falling back to HTTP: %s", exc)
             # Fall through to HTTP method
@@ -332,6 +364,10 @@ def _generate_with_sdk(api_key: str, prompt: str, image_path: str) -> bytes:
     except Exception as exc:
         logger.error("SDK generate_content failed: %s", exc)
         logger.debug("Attempted contents format: %s, type: %s", contents, type(contents))
+        # The SDK's APIError carries the HTTP status as .code
+        status = getattr(exc, "code", None)
+        if status in _REJECTED_STATUSES:
+            raise GeminiRequestRejected(f"Gemini API error (status {status}): {exc}") from exc
         # Re-raise to trigger fallback to HTTP
         raise GeminiServiceError(f"SDK generation failed: {exc}") from exc
     
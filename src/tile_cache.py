@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""Bounded least-recently-used store for rendered image tiles."""
+
+from collections import OrderedDict
+
+
+class TileCache:
+    """
+    Keep the most recently used rendered tiles, evicting the oldest first.
+
+    Keys are opaque to the cache; display_image uses
+    ``((zoomed_width, zoomed_height), (tile_x, tile_y))`` so tiles of
+    every zoom level can coexist and zooming back to a recent level does
+    not resample again.
+    """
+
+    def __init__(self, max_tiles):
+        self.max_tiles = max_tiles
+        self._tiles = OrderedDict()
+
+    def get(self, key):
+        """Return the tile stored under ``key`` (or None), marking it recent."""
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+        return tile
+
+    def put(self, key, tile):
+        """Store ``tile`` under ``key``, evicting the oldest tiles if full."""
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached tile."""
+        self._tiles.clear()
+
+    def __len__(self):
+        return len(self._tiles)
@@ -4,15 +4,93 @@
 """Cursor tracking and pixel color lookup for the debug panel."""
 
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Minimum time between two cursor updates (~60 Hz); high polling-rate
+# mice can deliver <Motion> events far faster than the screen refreshes
+MOTION_INTERVAL_MS = 16
+
+# Modes whose pixels already read as a gray level or an (R, G, B, ...) tuple
+_DIRECT_MODES = frozenset({"1", "L", "RGB", "RGBA", "RGBX"})
+
+# Direct modes whose pixels read as a single int
+_GRAY_MODES = frozenset({"1", "L"})
+
+
+def pixel_access(image):
+    """
+    Return a pixel access object for color lookups on ``image``.
+
+    Images in a direct mode are read in place. Anything else (palette,
+    LA, 16-bit, CMYK, ...) is converted to RGB once here, so every cursor
+    lookup yields a displayable color without per-event conversion.
+    """
+    if image.mode not in _DIRECT_MODES:
+        logger.debug("Converting %s image to RGB for color lookups", image.mode)
+        image = image.convert("RGB")
+    return image.load()
+
+
+def pixel_hex_formatter(image):
+    """
+    Return the function that turns a pixel from pixel_access(image) into a hex color.
+
+    Chosen once per image so the per-event lookup does not have to inspect
+    the pixel's type. bytes.hex() does the formatting in C, which is
+    noticeably cheaper than an f-string per event.
+    """
+    if image.mode in _GRAY_MODES:
+        return _gray_hex
+    return _rgb_hex
+
+
+def _gray_hex(pixel):
+    return "#" + bytes((pixel, pixel, pixel)).hex()
+
+
+def _rgb_hex(pixel):
+    # Alpha (or padding) is not part of the displayed color
+    return "#" + bytes(pixel[:3]).hex()
+
+
+def throttle_cursor_info(viewer, event):
+    """Run update_cursor_info at most once per MOTION_INTERVAL_MS."""
+    # Faster events only record themselves; the pending timer applies the
+    # latest, so the crosshair ends up at the final pointer position
+    viewer._motion_event = event
+    if viewer._motion_after_id is not None:
+        return
+
+    elapsed_ms = (time.monotonic() - viewer._last_motion_time) * 1000
+    if elapsed_ms >= MOTION_INTERVAL_MS:
+        _flush_motion(viewer)
+    else:
+        viewer._motion_after_id = viewer.root.after(
+            int(MOTION_INTERVAL_MS - elapsed_ms) + 1, lambda: _flush_motion(viewer)
+        )
+
+
+def _flush_motion(viewer):
+    """Apply the most recent <Motion> event."""
+    viewer._motion_after_id = None
+    viewer._last_motion_time = time.monotonic()
+    update_cursor_info(viewer, viewer._motion_event)
+
 
 def update_cursor_info(viewer, event):
     """Update cursor position and color hex in debug panel."""
+    if (event.x, event.y) == viewer.cursor_pos:
+        return
+
+    # <Motion> fires hundreds of times a second, so the debug logging below
+    # is skipped outright (not just filtered) unless it is enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+
     # Store cursor position
     viewer.cursor_pos = (event.x, event.y)
-    viewer.cursor_label.config(text=f"Cursor: ({event.x}, {event.y})")
+    viewer.cursor_var.set(f"Cursor: ({event.x}, {event.y})")
 
     # Update cursor crosshair lines
     _update_cursor_lines(viewer, event.x, event.y)
@@ -34,51 +112,55 @@ def update_cursor_info(viewer, event):
         # Ensure coordinates are within bounds
         orig_x = max(0, min(orig_x, viewer.original_size[0] - 1))
         orig_y = max(0, min(orig_y, viewer.original_size[1] - 1))
-        logger.debug("Cursor over image: canvas=(%d, %d) -> image=(%d, %d)", 
-                     event.x, event.y, orig_x, orig_y)
+        if debug:
+            logger.debug("Cursor over image: canvas=(%d, %d) -> image=(%d, %d)",
+                         event.x, event.y, orig_x, orig_y)
 
-        # Get pixel color from original image
+        # Get pixel color from the cached pixel access of the original image
         try:
-            pixel = viewer.original_image.getpixel((orig_x, orig_y))
-
-            # Convert to hex (handle different image modes)
-            if isinstance(pixel, int):  # Grayscale
-                hex_color = f"#{pixel:02x}{pixel:02x}{pixel:02x}"
-            elif len(pixel) >= 3:  # RGB/RGBA
-                r, g, b = pixel[:3]
-                hex_color = f"#{r:02x}{g:02x}{b:02x}"
-            else:
-                hex_color = "#000000"
-
-            logger.debug("Pixel color at (%d, %d): %s (pixel=%s)", orig_x, orig_y, hex_color, pixel)
-            viewer.hex_label.config(text=f"Hex: {hex_color}", fg=hex_color)
+            pixel = viewer._pixels[orig_x, orig_y]
+            hex_color = viewer._pixel_hex(pixel)
+
+            if debug:
+                logger.debug("Pixel color at (%d, %d): %s (pixel=%s)", orig_x, orig_y, hex_color, pixel)
+            _set_hex_label(viewer, f"Hex: {hex_color}", hex_color)
         except Exception as exc:  # pylint: disable=broad-except
             logger.debug("Error getting pixel color at (%d, %d): %s", orig_x, orig_y, exc)
-            viewer.hex_label.config(text=f"Error: {str(exc)}", fg='white')
+            _set_hex_label(viewer, f"Error: {str(exc)}", 'white')
     else:
-        logger.debug("Cursor outside image bounds: canvas=(%d, %d), image_bounds=(%d,%d)-(%d,%d)", 
-                     event.x, event.y, img_x, img_y, img_x + img_w, img_y + img_h)
-        viewer.hex_label.config(text="Hex: #000000", fg='white')
+        if debug:
+            logger.debug("Cursor outside image bounds: canvas=(%d, %d), image_bounds=(%d,%d)-(%d,%d)",
+                         event.x, event.y, img_x, img_y, img_x + img_w, img_y + img_h)
+        _set_hex_label(viewer, "Hex: #000000", 'white')
+
+
+def _set_hex_label(viewer, text, color):
+    """Configure the hex label, skipping the Tk call when nothing changed."""
+    state = (text, color)
+    if state != viewer._hex_label_state:
+        viewer.hex_label.config(text=text, fg=color)
+        viewer._hex_label_state = state
 
 
 def _update_cursor_lines(viewer, x, y):
     """Update the cursor crosshair lines (horizontal red, vertical blue)."""
-    canvas_width = viewer.canvas.winfo_width() or 800
-    canvas_height = viewer.canvas.winfo_height() or 600
-    
-    # Delete existing lines
-    if hasattr(viewer, 'cursor_h_line') and viewer.cursor_h_line is not None:
-        try:
-            viewer.canvas.delete(viewer.cursor_h_line)
-        except Exception:  # pylint: disable=broad-except
-            pass
-    
-    if hasattr(viewer, 'cursor_v_line') and viewer.cursor_v_line is not None:
-        try:
-            viewer.canvas.delete(viewer.cursor_v_line)
-        except Exception:  # pylint: disable=broad-except
-            pass
-    
+    canvas_width, canvas_height = viewer._canvas_size
+
+    h_coords = (0, y, canvas_width, y)
+    v_coords = (x, 0, x, canvas_height)
+
+    # Move the existing lines rather than deleting and recreating them. A
+    # purely horizontal or vertical mouse move leaves one line in place, so
+    # only the line whose coordinates changed is written to the canvas.
+    if viewer.cursor_h_line is not None and viewer.cursor_v_line is not None:
+        last_h, last_v = viewer._cursor_line_coords
+        if h_coords != last_h:
+            viewer.canvas.coords(viewer.cursor_h_line, *h_coords)
+        if v_coords != last_v:
+            viewer.canvas.coords(viewer.cursor_v_line, *v_coords)
+        viewer._cursor_line_coords = (h_coords, v_coords)
+        return
+
     # Draw horizontal line (red) - full width
     viewer.cursor_h_line = viewer.canvas.create_line(
         0, y, canvas_width, y,
@@ -97,10 +179,12 @@ def _update_cursor_lines(viewer, x, y):
         tags='cursor_line'
     )
     
+    viewer._cursor_line_coords = (h_coords, v_coords)
+
     # Move lines to top of drawing order (above image)
     viewer.canvas.tag_raise('cursor_line')
     
-    logger.debug("Cursor lines updated at (%d, %d)", x, y)
+    logger.debug("Cursor lines created at (%d, %d)", x, y)
 
 
 def redraw_cursor_lines(viewer):
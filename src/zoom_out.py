@@ -5,6 +5,8 @@
 
 import logging
 
+from src.display_image import begin_interactive
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,12 +20,13 @@ def zoom_out(viewer, event=None):
 
     if abs(new_zoom - viewer.zoom_level) > 0.01:
         viewer.zoom_level = new_zoom
+        begin_interactive(viewer)
         if viewer.image_size[0] > 0 and viewer.image_size[1] > 0:
             logger.debug("Redisplaying with zoom center at (%d, %d)", cursor_x, cursor_y)
-            viewer.display_image(zoom_center=(cursor_x, cursor_y))
+            viewer.schedule_redraw(zoom_center=(cursor_x, cursor_y))
         else:
             logger.debug("Redisplaying without zoom center (invalid image size)")
-            viewer.display_image()
+            viewer.schedule_redraw()
     else:
         logger.debug("Zoom change too small, skipping redisplay")
     return "break"
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""Tests for response handling and key normalization in the Gemini service."""
+
+import pytest
+
+from src.services import gemini_image_service as service
+from src.services.gemini_image_service import GeminiServiceError
+
+
+class FakeResponse:
+    """Streamed response stand-in that records how much of the body was read."""
+
+    def __init__(self, body=b"", status_code=200, headers=None, chunk_size=4):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self._chunk_size = chunk_size
+        self.chunks_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self._body), self._chunk_size):
+            self.chunks_read += 1
+            yield self._body[start:start + self._chunk_size]
+
+
+class FakeSession:
+    """Returns the queued responses in order, one per post()."""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        return self._responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(service.time, "sleep", delays.append)
+    return delays
+
+
+def test_read_capped_returns_the_body():
+    assert service._read_capped(FakeResponse(b"0123456789")) == b"0123456789"
+
+
+def test_read_capped_rejects_a_large_content_length_before_reading():
+    response = FakeResponse(b"{}", headers={"Content-Length": str(service.MAX_RESPONSE_BYTES + 1)})
+
+    with pytest.raises(GeminiServiceError, match="too large"):
+        service._read_capped(response)
+    assert response.chunks_read == 0
+
+
+def test_read_capped_stops_a_stream_over_the_cap(monkeypatch):
+    monkeypatch.setattr(service, "MAX_RESPONSE_BYTES", 10)
+    # No Content-Length, as with a chunked response
+    response = FakeResponse(b"x" * 100)
+
+    with pytest.raises(GeminiServiceError, match="exceeded"):
+        service._read_capped(response)
+    assert response.chunks_read == 3
+
+
+def test_fetch_with_backoff_retries_an_unreadable_body(monkeypatch, sleeps):
+    session = FakeSession([FakeResponse(b'{"candid'), FakeResponse(b'{"candidates": []}')])
+    monkeypatch.setattr(service, "_SESSION", session)
+
+    result = service._fetch_with_backoff("https://example.invalid", {}, {}, retries=3)
+
+    assert result == {"candidates": []}
+    assert session.calls == 2
+    assert len(sleeps) == 1
+
+
+def test_fetch_with_backoff_gives_up_on_unreadable_bodies(monkeypatch, sleeps):
+    session = FakeSession([FakeResponse(b"<html>") for _ in range(3)])
+    monkeypatch.setattr(service, "_SESSION", session)
+
+    with pytest.raises(GeminiServiceError, match="unreadable"):
+        service._fetch_with_backoff("https://example.invalid", {}, {}, retries=3)
+    assert session.calls == 3
+    assert len(sleeps) == 2
+
+
+def _char_loop_key(key):
+    """The character-by-character scan _normalize_api_key used before the regex."""
+    first_aiza = key.find("AIza")
+    valid_chars = []
+    for char in key[max(first_aiza, 0):]:
+        if not (char.isalnum() or char in "-_="):
+            break
+        valid_chars.append(char)
+    return "".join(valid_chars)
+
+
+KEY = "AIzaSyD-abc_123="
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (KEY, KEY),
+        (f"  {KEY}\n", KEY),
+        (f"https://generativelanguage.googleapis.com/v1beta/models/x:generateContent?key={KEY}&alt=sse", KEY),
+        (f"&key={KEY}#frag", KEY),
+        (f"export GEMINI={KEY} more", KEY),
+        (f"{KEY}{KEY}", f"{KEY}{KEY}"),
+        (f"{KEY}\x00junk", KEY),
+        (f"{KEY}/path", KEY),
+        (f"{KEY}é9", f"{KEY}é9"),
+        ("no-key here", "no-key"),
+        ("'quoted'", ""),
+        ("", ""),
+    ],
+)
+def test_normalize_api_key(raw, expected):
+    assert service._normalize_api_key(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "key",
+    [f"{KEY} tail", f"junk {KEY}", f"{KEY}\t", f"{KEY}٣x", f"{KEY}²", f"{KEY}.x", "plain_key-1=", "$AIza"],
+)
+def test_normalize_api_key_matches_the_character_scan(key):
+    assert service._normalize_api_key(key) == _char_loop_key(key)[:60].rstrip("&?# ")
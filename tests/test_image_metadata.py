@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 Akshat Kotpalliwar (alias IntegerAlex) <inquiry.akshatkotpalliwar@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""Tests for EXIF extraction and formatting in the metadata panel."""
+
+import pytest
+from PIL import ExifTags, Image
+from PIL.TiffImagePlugin import IFDRational
+
+from src.image_metadata import _extract_exif, _format_exposure, _format_focal_length, _metadata_cache, build_metadata_text
+
+
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    _metadata_cache.clear()
+    yield
+    _metadata_cache.clear()
+
+
+@pytest.fixture
+def camera_jpeg(tmp_path):
+    # Make sits in the base IFD; camera settings in the Exif sub-IFD, as
+    # cameras write them
+    exif = Image.Exif()
+    exif[ExifTags.Base.Make] = "Canon"
+    settings = exif.get_ifd(ExifTags.IFD.Exif)
+    settings[ExifTags.Base.ExposureTime] = IFDRational(1, 250)
+    settings[ExifTags.Base.FocalLength] = IFDRational(50, 1)
+    settings[ExifTags.Base.FNumber] = IFDRational(28, 10)
+    settings[ExifTags.Base.ISOSpeedRatings] = 200
+    gps = exif.get_ifd(ExifTags.IFD.GPSInfo)
+    gps[ExifTags.GPS.GPSLatitudeRef] = "N"
+    gps[ExifTags.GPS.GPSLatitude] = (52.0, 30.0, 0.0)
+    gps[ExifTags.GPS.GPSLongitudeRef] = "W"
+    gps[ExifTags.GPS.GPSLongitude] = (1.0, 15.0, 36.0)
+
+    path = tmp_path / "camera.jpg"
+    Image.new("RGB", (8, 8)).save(path, exif=exif)
+    return path
+
+
+def test_extract_exif_reads_the_exif_sub_ifd(camera_jpeg):
+    with Image.open(camera_jpeg) as image:
+        exif = _extract_exif(image)
+
+    assert exif == {
+        "Make": "Canon",
+        "FNumber": "f/2.8",
+        "ExposureTime": "1/250s",
+        "ISOSpeedRatings": "200",
+        "FocalLength": "50.0 mm",
+        "GPSInfo": "52.500000, -1.260000",
+    }
+
+
+def test_build_metadata_text_lists_sub_ifd_tags(camera_jpeg):
+    with Image.open(camera_jpeg) as image:
+        text = build_metadata_text(str(camera_jpeg), image)
+
+    assert " • Exposure: 1/250s" in text
+    assert " • Focal Length: 50.0 mm" in text
+
+
+def test_extract_exif_without_exif_is_empty():
+    assert _extract_exif(Image.new("RGB", (8, 8))) == {}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(IFDRational(1, 250), "1/250s"), ((1, 60), "1/60s"), (2, "2s")],
+)
+def test_format_exposure(value, expected):
+    assert _format_exposure(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(IFDRational(35, 1), "35.0 mm"), ((85, 2), "42.5 mm"), (24, "24 mm")],
+)
+def test_format_focal_length(value, expected):
+    assert _format_focal_length(value) == expected